@@ -227,6 +227,8 @@ class AbstractSource(Source, ABC):
             stream_instance.state = stream_state  # type: ignore # we check that state in the dir(stream_instance)
             logger.info(f"Setting state of {self.name} stream to {stream_state}")
 
+        # Bind the conversion once instead of resolving the method for every record
+        get_message = self._get_message
         for record_data_or_message in stream_instance.read_incremental(
             configured_stream.cursor_field,
             logger,
@@ -236,7 +238,7 @@ class AbstractSource(Source, ABC):
             self.per_stream_state_enabled,
             internal_config,
         ):
-            yield self._get_message(record_data_or_message, stream_instance)
+            yield get_message(record_data_or_message, stream_instance)
 
     def _emit_queued_messages(self) -> Iterable[AirbyteMessage]:
         if self.message_repository:
@@ -251,8 +253,10 @@ class AbstractSource(Source, ABC):
         internal_config: InternalConfig,
     ) -> Iterator[AirbyteMessage]:
         total_records_counter = 0
+        # Bind the conversion once instead of resolving the method for every record
+        get_message = self._get_message
         for record_data_or_message in stream_instance.read_full_refresh(configured_stream.cursor_field, logger, self._slice_logger):
-            message = self._get_message(record_data_or_message, stream_instance)
+            message = get_message(record_data_or_message, stream_instance)
             yield message
             if message.type == MessageType.RECORD:
                 total_records_counter += 1
@@ -2,10 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from queue import Queue
+import time
+from queue import SimpleQueue
+from typing import List
 
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem, RecordBatch
 
 
 class PartitionReader:
@@ -13,26 +16,52 @@ class PartitionReader:
     Generates records from a partition and puts them in a queue.
     """
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    DEFAULT_BATCH_SIZE = 128
+    DEFAULT_MAX_BATCH_AGE_SECONDS = 0.1
+
+    def __init__(
+        self,
+        queue: SimpleQueue[QueueItem],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_age_seconds: float = DEFAULT_MAX_BATCH_AGE_SECONDS,
+    ) -> None:
         """
         :param queue: The queue to put the records in.
+        :param batch_size: The maximum number of records to put in the queue as a single RecordBatch.
+        :param max_batch_age_seconds: The maximum time since the last item was put in the queue before the buffered records are flushed.
         """
         self._queue = queue
+        self._batch_size = batch_size
+        self._max_batch_age_seconds = max_batch_age_seconds
 
     def process_partition(self, partition: Partition) -> None:
         """
         Process a partition and put the records in the output queue.
-        When all the partitions are added to the queue, a sentinel is added to the queue to indicate that all the partitions have been generated.
+        Records are put in the queue in batches of at most `batch_size` records. The batch is flushed early if `max_batch_age_seconds`
+        elapsed since the last item was put in the queue so that slow partitions don't starve the consumer waiting on the queue.
+        When all the records of the partition are added to the queue, a sentinel is added to the queue to indicate that the partition has been processed.
 
-        If an exception is encountered, the exception will be caught and put in the queue.
+        If an exception is encountered, the records read so far are flushed, then the exception will be caught and put in the queue.
 
         This method is meant to be called from a thread.
         :param partition: The partition to read data from
         :return: None
         """
+        batch: List[Record] = []
+        last_put_time = time.monotonic()
         try:
             for record in partition.read():
-                self._queue.put(record)
+                batch.append(record)
+                if len(batch) >= self._batch_size or time.monotonic() - last_put_time >= self._max_batch_age_seconds:
+                    self._queue.put(RecordBatch(batch))
+                    batch = []
+                    last_put_time = time.monotonic()
+            self._flush(batch)
             self._queue.put(PartitionCompleteSentinel(partition))
         except Exception as e:
+            self._flush(batch)
             self._queue.put(e)
+
+    def _flush(self, batch: List[Record]) -> None:
+        if batch:
+            self._queue.put(RecordBatch(batch))
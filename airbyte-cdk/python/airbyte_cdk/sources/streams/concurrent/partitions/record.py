@@ -10,10 +10,15 @@ class Record:
     Represents a record read from a stream.
     """
 
+    # Records are created for every row read from a partition so they don't carry a per-instance __dict__
+    __slots__ = ("data",)
+
     def __init__(self, data: Mapping[str, Any]):
         self.data = data
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Record):
             return False
         return self.data == other.data
@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Union
+from typing import List, Union
 
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
@@ -16,6 +16,9 @@ class PartitionCompleteSentinel:
     Includes a pointer to the partition that was processed.
     """
 
+    # One sentinel is created per partition so it only stores the partition reference
+    __slots__ = ("partition",)
+
     def __init__(self, partition: Partition):
         """
         :param partition: The partition that was processed
@@ -23,7 +26,22 @@ class PartitionCompleteSentinel:
         self.partition = partition
 
 
+class RecordBatch:
+    """
+    A group of records read from the same partition.
+    Records are put on the queue in batches so that the queue is not locked once per record.
+    """
+
+    __slots__ = ("records",)
+
+    def __init__(self, records: List[Record]):
+        """
+        :param records: The records, in the order they were read from the partition
+        """
+        self.records = records
+
+
 """
 Typedef representing the items that can be added to the ThreadBasedConcurrentStream
 """
-QueueItem = Union[Record, Partition, PartitionCompleteSentinel, PARTITIONS_GENERATED_SENTINEL, Partition, Exception]
+QueueItem = Union[RecordBatch, Partition, PartitionCompleteSentinel, PARTITIONS_GENERATED_SENTINEL, Partition, Exception]
@@ -3,12 +3,12 @@
 #
 
 import concurrent
-import time
+from collections import deque
 from concurrent.futures import Future
 from functools import lru_cache
 from logging import Logger
-from queue import Queue
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from queue import SimpleQueue
+from typing import Any, Callable, Deque, Iterable, List, Mapping, Optional
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.message import MessageRepository
@@ -20,7 +20,12 @@ from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionRea
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PARTITIONS_GENERATED_SENTINEL, PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PARTITIONS_GENERATED_SENTINEL,
+    PartitionCompleteSentinel,
+    QueueItem,
+    RecordBatch,
+)
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 
 
@@ -51,6 +56,10 @@ class ThreadBasedConcurrentStream(AbstractStream):
         self._stream_partition_generator = partition_generator
         self._max_workers = max_workers
         self._threadpool = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="workerpool")
+        # Partitions are generated on a dedicated thread so that the generation does not hold one of the workers reading partitions
+        self._partition_generation_threadpool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="partitiongenerator"
+        )
         self._name = name
         self._json_schema = json_schema
         self._availability_strategy = availability_strategy
@@ -72,81 +81,105 @@ class ThreadBasedConcurrentStream(AbstractStream):
         Algorithm:
         1. Submit a future to generate the stream's partition to process.
           - This has to be done asynchronously because we sometimes need to submit requests to the API to generate all partitions (eg for substreams).
+          - The future runs on a dedicated thread so that partitions can be read while the next ones are being generated.
           - The future will add the partitions to process on a work queue.
         2. Continuously poll work from the work queue until all partitions are generated and processed
           - If the next work item is an Exception, stop the threadpool and raise it.
           - If the next work item is a partition, submit a future to process it.
-            - The future will add the records to emit on the work queue.
-            - Add the partitions to the partitions_to_done dict so we know it needs to complete for the sync to succeed.
-          - If the next work item is a record, yield the record.
+            - The future will add the records to emit on the work queue, grouped in RecordBatches.
+            - Increment the number of submitted partitions so we know it needs to complete for the sync to succeed.
+          - If the next work item is a RecordBatch, yield each of its records.
           - If the next work item is PARTITIONS_GENERATED_SENTINEL, all the partitions were generated.
           - If the next work item is a PartitionCompleteSentinel, a partition is done processing.
-            - Update the value in partitions_to_done to True so we know the partition is completed.
+            - Increment the number of completed partitions so we know the partition is completed.
         """
         self._logger.debug(f"Processing stream slices for {self.name}")
-        futures: List[Future[Any]] = []
-        queue: Queue[QueueItem] = Queue()
+        futures: Deque[Future[Any]] = deque()
+        queue: SimpleQueue[QueueItem] = SimpleQueue()
         partition_generator = PartitionEnqueuer(queue, PARTITIONS_GENERATED_SENTINEL)
         partition_reader = PartitionReader(queue)
 
-        self._submit_task(futures, partition_generator.generate_partitions, self._stream_partition_generator)
+        # The partition generation future is kept out of `futures` as it is pending for most of the read and would prevent the completed
+        # partition futures from being dropped
+        partition_generation_future = self._partition_generation_threadpool.submit(
+            partition_generator.generate_partitions, self._stream_partition_generator
+        )
+
+        # Only the number of partitions is tracked so that partitions don't need to be hashed nor kept in memory until the end of the read
+        submitted_partitions = 0
+        completed_partitions = 0
 
-        # True -> partition is done
-        # False -> partition is not done
-        partitions_to_done: Dict[Partition, bool] = {}
+        # Resolved once per read as they are used for every record and partition
+        observe_record = self._cursor.observe
+        should_log_slice_message = self._slice_logger.should_log_slice_message(self._logger)
 
         finished_partitions = False
         while record_or_partition_or_exception := queue.get(block=True, timeout=self._timeout_seconds):
-            if isinstance(record_or_partition_or_exception, Exception):
-                # An exception was raised while processing the stream
-                # Stop the threadpool and raise it
-                self._stop_and_raise_exception(record_or_partition_or_exception)
-            elif record_or_partition_or_exception == PARTITIONS_GENERATED_SENTINEL:
-                # All partitions were generated
-                finished_partitions = True
+            # Checks are ordered from the most to the least frequent item. RecordBatch is never subclassed so an exact type check is enough
+            if type(record_or_partition_or_exception) is RecordBatch:
+                # Emit records
+                for record in record_or_partition_or_exception.records:
+                    yield record
+                    observe_record(record)
             elif isinstance(record_or_partition_or_exception, PartitionCompleteSentinel):
                 # All records for a partition were generated
-                if record_or_partition_or_exception.partition not in partitions_to_done:
+                if completed_partitions >= submitted_partitions:
                     raise RuntimeError(
-                        f"Received sentinel for partition {record_or_partition_or_exception.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{partitions_to_done}"
+                        f"Received sentinel for partition {record_or_partition_or_exception.partition} but all the {submitted_partitions} submitted partitions were already completed. This is indicative of a bug in the CDK. Please contact support."
                     )
-                partitions_to_done[record_or_partition_or_exception.partition] = True
+                completed_partitions += 1
                 self._cursor.close_partition(record_or_partition_or_exception.partition)
-            elif isinstance(record_or_partition_or_exception, Record):
-                # Emit records
-                yield record_or_partition_or_exception
-                self._cursor.observe(record_or_partition_or_exception)
             elif isinstance(record_or_partition_or_exception, Partition):
                 # A new partition was generated and must be processed
-                partitions_to_done[record_or_partition_or_exception] = False
-                if self._slice_logger.should_log_slice_message(self._logger):
+                submitted_partitions += 1
+                if should_log_slice_message:
                     self._message_repository.emit_message(
                         self._slice_logger.create_slice_log_message(record_or_partition_or_exception.to_slice())
                     )
                 self._submit_task(futures, partition_reader.process_partition, record_or_partition_or_exception)
-            if finished_partitions and all(partitions_to_done.values()):
+            elif record_or_partition_or_exception is PARTITIONS_GENERATED_SENTINEL:
+                # All partitions were generated
+                finished_partitions = True
+            elif isinstance(record_or_partition_or_exception, Exception):
+                # An exception was raised while processing the stream
+                # Stop the threadpool and raise it
+                self._stop_and_raise_exception(record_or_partition_or_exception)
+            if finished_partitions and completed_partitions == submitted_partitions:
                 # All partitions were generated and process. We're done here
                 break
 
-        self._check_for_errors(futures)
+        self._check_for_errors([partition_generation_future, *futures])
 
-    def _submit_task(self, futures: List[Future[Any]], function: Callable[..., Any], *args: Any) -> None:
+    def _submit_task(self, futures: Deque[Future[Any]], function: Callable[..., Any], *args: Any) -> None:
         # Submit a task to the threadpool, waiting if there are too many pending tasks
+        self._drop_completed_leading_futures(futures)
         self._wait_while_too_many_pending_futures(futures)
         futures.append(self._threadpool.submit(function, *args))
 
-    def _wait_while_too_many_pending_futures(self, futures: List[Future[Any]]) -> None:
+    def _drop_completed_leading_futures(self, futures: Deque[Future[Any]]) -> None:
+        """
+        Remove the completed futures at the head of the deque so that it does not grow linearly with the number of partitions. Partitions
+        mostly complete in submission order so this is amortized constant time. Completed futures queued behind a pending one are
+        removed by `_prune_futures` once the limit of pending tasks is reached.
+
+        If a future has an exception, it'll raise and kill the stream operation.
+        """
+        while futures and futures[0].done():
+            self._raise_if_failed(futures.popleft())
+
+    def _wait_while_too_many_pending_futures(self, futures: Deque[Future[Any]]) -> None:
         # Wait until the number of pending tasks is < self._max_concurrent_tasks
         while True:
             self._prune_futures(futures)
             if len(futures) < self._max_concurrent_tasks:
                 break
             self._logger.info("Main thread is sleeping because the task queue is full...")
-            time.sleep(self._sleep_time)
+            # Wake up as soon as a task completes instead of always sleeping for the full sleep time
+            concurrent.futures.wait(futures, timeout=self._sleep_time, return_when=concurrent.futures.FIRST_COMPLETED)
 
-    def _prune_futures(self, futures: List[Future[Any]]) -> None:
+    def _prune_futures(self, futures: Deque[Future[Any]]) -> None:
         """
-        Take a list in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
+        Take a deque in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
         operation.
 
         Pruning this list safely relies on the assumptions that only the main thread can modify the list of futures.
@@ -154,15 +187,22 @@ class ThreadBasedConcurrentStream(AbstractStream):
         if len(futures) < self._max_concurrent_tasks:
             return
 
-        for index in range(len(futures)):
-            future = futures[index]
-            optional_exception = future.exception()
-            if optional_exception:
-                exception = RuntimeError(f"Failed reading from stream {self.name} with error: {optional_exception}")
-                self._stop_and_raise_exception(exception)
+        pending_futures = []
+        for future in futures:
+            if not future.done():
+                pending_futures.append(future)
+                continue
+            self._raise_if_failed(future)
 
-            if future.done():
-                futures.pop(index)
+        # Rebuild the collection in a single pass instead of removing futures one by one
+        futures.clear()
+        futures.extend(pending_futures)
+
+    def _raise_if_failed(self, future: Future[Any]) -> None:
+        optional_exception = future.exception()
+        if optional_exception:
+            exception = RuntimeError(f"Failed reading from stream {self.name} with error: {optional_exception}")
+            self._stop_and_raise_exception(exception)
 
     def _check_for_errors(self, futures: List[Future[Any]]) -> None:
         exceptions_from_futures = [f for f in [future.exception() for future in futures] if f is not None]
@@ -176,6 +216,7 @@ class ThreadBasedConcurrentStream(AbstractStream):
                 self._stop_and_raise_exception(exception)
 
     def _stop_and_raise_exception(self, exception: BaseException) -> None:
+        self._partition_generation_threadpool.shutdown(wait=False, cancel_futures=True)
         self._threadpool.shutdown(wait=False, cancel_futures=True)
         raise exception
 
@@ -194,7 +235,9 @@ class ThreadBasedConcurrentStream(AbstractStream):
     def get_json_schema(self) -> Mapping[str, Any]:
         return self._json_schema
 
+    @lru_cache(maxsize=None)
     def as_airbyte_stream(self) -> AirbyteStream:
+        # The stream's name, schema, cursor and primary key are set at instantiation so the AirbyteStream only needs to be built once
         stream = AirbyteStream(name=self.name, json_schema=dict(self._json_schema), supported_sync_modes=[SyncMode.full_refresh])
 
         if self._namespace:
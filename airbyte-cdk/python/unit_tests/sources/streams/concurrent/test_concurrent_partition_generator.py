@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from queue import Queue
+from queue import SimpleQueue
 from unittest.mock import Mock
 
 import pytest
@@ -16,7 +16,7 @@ from airbyte_cdk.sources.streams.concurrent.partitions.types import PARTITIONS_G
     "slices", [pytest.param([], id="test_no_partitions"), pytest.param([{"partition": 1}, {"partition": 2}], id="test_two_partitions")]
 )
 def test_partition_generator(slices):
-    queue = Queue()
+    queue = SimpleQueue()
     partition_generator = PartitionEnqueuer(queue, PARTITIONS_GENERATED_SENTINEL)
 
     stream = Mock()
@@ -2,16 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from queue import Queue
+import time
+from queue import SimpleQueue
 from unittest.mock import Mock
 
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, RecordBatch
 
 
 def test_partition_reader():
-    queue = Queue()
+    queue = SimpleQueue()
     partition_reader = PartitionReader(queue)
 
     stream_partition = Mock()
@@ -24,9 +25,75 @@ def test_partition_reader():
     partition_reader.process_partition(stream_partition)
 
     actual_records = []
-    while record := queue.get():
-        if isinstance(record, PartitionCompleteSentinel):
+    while item := queue.get():
+        if isinstance(item, PartitionCompleteSentinel):
             break
-        actual_records.append(record)
+        actual_records.extend(item.records)
 
     assert records == actual_records
+
+
+def test_partition_reader_splits_records_in_batches():
+    queue = SimpleQueue()
+    partition_reader = PartitionReader(queue, batch_size=2, max_batch_age_seconds=60)
+
+    stream_partition = Mock()
+    records = [Record({"id": i}) for i in range(5)]
+    stream_partition.read.return_value = iter(records)
+
+    partition_reader.process_partition(stream_partition)
+
+    batches = []
+    while item := queue.get():
+        if isinstance(item, PartitionCompleteSentinel):
+            break
+        batches.append(item.records)
+
+    assert batches == [records[0:2], records[2:4], records[4:5]]
+
+
+def test_partition_reader_flushes_records_before_putting_exception_in_queue():
+    queue = SimpleQueue()
+    partition_reader = PartitionReader(queue)
+
+    record = Record({"id": 1})
+    exception = ValueError("error")
+
+    def _read():
+        yield record
+        raise exception
+
+    stream_partition = Mock()
+    stream_partition.read.return_value = _read()
+
+    partition_reader.process_partition(stream_partition)
+
+    batch = queue.get()
+    assert isinstance(batch, RecordBatch)
+    assert batch.records == [record]
+    assert queue.get() is exception
+
+
+def test_given_slow_partition_when_process_partition_then_flush_records_before_the_batch_is_full():
+    queue = SimpleQueue()
+    partition_reader = PartitionReader(queue, batch_size=10, max_batch_age_seconds=0.05)
+
+    records = [Record({"id": i}) for i in range(3)]
+
+    def _read():
+        for record in records:
+            time.sleep(0.1)
+            yield record
+
+    stream_partition = Mock()
+    stream_partition.read.return_value = _read()
+
+    partition_reader.process_partition(stream_partition)
+
+    batches = []
+    while item := queue.get():
+        if isinstance(item, PartitionCompleteSentinel):
+            break
+        batches.append(item.records)
+
+    assert batches == [[record] for record in records]
@@ -2,8 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import concurrent.futures
+import threading
+import time
 import unittest
-from unittest.mock import Mock, call
+from collections import deque
+from unittest.mock import Mock, call, patch
 
 import pytest
 from airbyte_cdk.models import AirbyteStream, SyncMode
@@ -122,7 +126,46 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
 
         self._message_repository.emit_message.assert_called_once_with(slice_log_message)
 
-    def test_wait_while_task_queue_is_full(self):
+    def test_partitions_are_read_while_partitions_are_generated(self):
+        partition_read = threading.Event()
+        record = Record({"id": 1})
+
+        def _read():
+            partition_read.set()
+            return [record]
+
+        partition = Mock(spec=Partition)
+        partition.read.side_effect = _read
+        self._slice_logger.should_log_slice_message.return_value = False
+
+        def _generate():
+            yield partition
+            # With a single worker, the partition can only be read if the generation does not run on that worker
+            if not partition_read.wait(timeout=1):
+                raise RuntimeError("Partition was not read while partitions were being generated")
+
+        self._partition_generator.generate.side_effect = _generate
+
+        assert list(self._stream.read()) == [record]
+
+    def test_given_slow_partition_when_read_then_records_are_emitted_within_the_timeout(self):
+        records = [Record({"id": i}) for i in range(4)]
+
+        def _read():
+            # Each record is produced within the 1 second timeout but the whole partition is not
+            for record in records:
+                time.sleep(0.6)
+                yield record
+
+        partition = Mock(spec=Partition)
+        partition.read.side_effect = _read
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = [partition]
+
+        assert list(self._stream.read()) == records
+
+    @patch("concurrent.futures.wait")
+    def test_wait_while_task_queue_is_full(self, mock_wait):
         f1 = Mock()
         f2 = Mock()
 
@@ -131,11 +174,13 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
         f1.exception.return_value = None
         f2.done.side_effect = [False, True]
         f2.exception.return_value = None
-        futures = [f1, f2]
+        futures = deque([f1, f2])
         self._stream._wait_while_too_many_pending_futures(futures)
 
         f1.done.assert_has_calls([call(), call()])
         f2.done.assert_has_calls([call(), call()])
+        mock_wait.assert_called_once()
+        assert mock_wait.call_args.kwargs["return_when"] == concurrent.futures.FIRST_COMPLETED
 
     def test_given_exception_then_fail_immediately(self):
         f1 = Mock()
@@ -144,13 +189,51 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
         # Verify that the done() method will be called until only one future is still running
         f1.done.return_value = False
         f1.exception.return_value = None
-        f2.done.return_value = False
+        f2.done.return_value = True
         f2.exception.return_value = ValueError("An exception")
-        futures = [f1, f2]
+        futures = deque([f1, f2])
 
         with pytest.raises(RuntimeError):
             self._stream._wait_while_too_many_pending_futures(futures)
 
+    def test_prune_futures_removes_all_completed_futures(self):
+        done_futures = [Mock() for _ in range(3)]
+        for f in done_futures:
+            f.done.return_value = True
+            f.exception.return_value = None
+        pending_future = Mock()
+        pending_future.done.return_value = False
+        futures = deque([done_futures[0], pending_future, done_futures[1], done_futures[2]])
+
+        self._stream._prune_futures(futures)
+
+        assert futures == deque([pending_future])
+        pending_future.exception.assert_not_called()
+
+    def test_drop_completed_leading_futures_stops_at_the_first_pending_future(self):
+        done_futures = [Mock() for _ in range(2)]
+        for f in done_futures:
+            f.done.return_value = True
+            f.exception.return_value = None
+        pending_future = Mock()
+        pending_future.done.return_value = False
+        completed_after_pending_future = Mock()
+        completed_after_pending_future.done.return_value = True
+        futures = deque([*done_futures, pending_future, completed_after_pending_future])
+
+        self._stream._drop_completed_leading_futures(futures)
+
+        assert futures == deque([pending_future, completed_after_pending_future])
+        completed_after_pending_future.exception.assert_not_called()
+
+    def test_given_completed_future_at_the_head_failed_when_submit_task_then_raise(self):
+        failed_future = Mock()
+        failed_future.done.return_value = True
+        failed_future.exception.return_value = ValueError("An exception")
+
+        with pytest.raises(RuntimeError):
+            self._stream._submit_task(deque([failed_future]), lambda: None)
+
     def test_as_airbyte_stream(self):
         expected_airbyte_stream = AirbyteStream(
             name=self._name,
@@ -165,6 +248,9 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
 
         assert expected_airbyte_stream == actual_airbyte_stream
 
+    def test_as_airbyte_stream_is_only_built_once(self):
+        assert self._stream.as_airbyte_stream() is self._stream.as_airbyte_stream()
+
     def test_as_airbyte_stream_with_primary_key(self):
         json_schema = {
             "type": "object",
@@ -110,17 +110,20 @@ class AirbytePythonConnectorBaseImage(bases.AirbyteConnectorBaseImage):
         """Runs sanity checks on the base image container.
         This method is called before image publication.
         Consider it like a pre-flight check before take-off to the remote registry.
+        The checks are independent from each other so they run concurrently.
 
         Args:
             platform (dagger.Platform): The platform on which the sanity checks should run.
         """
         container = self.get_container(platform)
-        await base_sanity_checks.check_timezone_is_utc(container)
-        await base_sanity_checks.check_a_command_is_available_using_version_option(container, "bash")
-        await python_sanity_checks.check_python_version(container, "3.9.18")
-        await python_sanity_checks.check_pip_version(container, "23.2.1")
-        await python_sanity_checks.check_poetry_version(container, "1.6.1")
-        await python_sanity_checks.check_python_image_has_expected_env_vars(container)
-        await base_sanity_checks.check_a_command_is_available_using_version_option(container, "socat", "-V")
-        await base_sanity_checks.check_socat_version(container, "1.7.4.4")
-        await python_sanity_checks.check_cdk_system_dependencies(container)
+        await base_sanity_checks.run_concurrently(
+            base_sanity_checks.check_timezone_is_utc(container),
+            base_sanity_checks.check_a_command_is_available_using_version_option(container, "bash"),
+            python_sanity_checks.check_python_version(container, "3.9.18"),
+            python_sanity_checks.check_pip_version(container, "23.2.1"),
+            python_sanity_checks.check_poetry_version(container, "1.6.1"),
+            python_sanity_checks.check_python_image_has_expected_env_vars(container),
+            base_sanity_checks.check_a_command_is_available_using_version_option(container, "socat", "-V"),
+            base_sanity_checks.check_socat_version(container, "1.7.4.4"),
+            python_sanity_checks.check_cdk_system_dependencies(container),
+        )
@@ -82,9 +82,8 @@ async def check_python_image_has_expected_env_vars(python_image_container: dagge
         "OTEL_TRACE_PARENT",
         "TRACEPARENT",
     }
-    # It's not suboptimal to call printenv multiple times because the printenv output is cached.
-    for expected_env_var in expected_env_vars:
-        await base_sanity_checks.check_env_var_with_printenv(python_image_container, expected_env_var)
+    # Check all the env vars against a single printenv output instead of running printenv once per env var.
+    await base_sanity_checks.check_env_vars_with_printenv(python_image_container, dict.fromkeys(expected_env_vars))
 
 
 async def check_nltk_data(python_image_container: dagger.Container):
@@ -148,6 +147,8 @@ async def check_poppler_utils_version(python_image_container: dagger.Container,
 
 
 async def check_cdk_system_dependencies(python_image_container: dagger.Container):
-    await check_nltk_data(python_image_container)
-    await check_tesseract_version(python_image_container, "5.3.0")
-    await check_poppler_utils_version(python_image_container, "22.12.0")
+    await base_sanity_checks.run_concurrently(
+        check_nltk_data(python_image_container),
+        check_tesseract_version(python_image_container, "5.3.0"),
+        check_poppler_utils_version(python_image_container, "22.12.0"),
+    )
@@ -2,13 +2,32 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 import re
-from typing import Optional
+from typing import Awaitable, Mapping, Optional
 
 import dagger
 from base_images import errors
 
 
+async def run_concurrently(*checks: Awaitable[None]):
+    """Run independent sanity checks concurrently and raise the first failure.
+
+    Every check runs to completion before raising so that no check keeps executing commands in the container
+    while the caller handles the failure, and no exception is left unretrieved.
+
+    Args:
+        *checks (Awaitable[None]): The sanity checks to run.
+
+    Raises:
+        BaseException: The exception raised by the first failing check, in the order the checks were given.
+    """
+    results = await asyncio.gather(*checks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 async def check_env_var_with_printenv(
     container: dagger.Container, expected_env_var_name: str, expected_env_var_value: Optional[str] = None
 ):
@@ -22,17 +41,32 @@ async def check_env_var_with_printenv(
     Raises:
         errors.SanityCheckError: Raised if the environment variable is not defined or if it has an unexpected value.
     """
+    await check_env_vars_with_printenv(container, {expected_env_var_name: expected_env_var_value})
+
+
+async def check_env_vars_with_printenv(container: dagger.Container, expected_env_vars: Mapping[str, Optional[str]]):
+    """This checks if multiple environment variables are correctly defined by calling the printenv command once in a container.
+
+    Args:
+        container (dagger.Container): The container on which the sanity checks should run.
+        expected_env_vars (Mapping[str, Optional[str]]): The expected environment variable names mapped to their expected value.
+            A None value only checks that the environment variable is defined.
+
+    Raises:
+        errors.SanityCheckError: Raised if an environment variable is not defined or if it has an unexpected value.
+    """
     try:
         printenv_output = await container.with_exec(["printenv"], skip_entrypoint=True).stdout()
     except dagger.ExecError as e:
         raise errors.SanityCheckError(e)
-    env_vars = {line.split("=")[0]: line.split("=")[1] for line in printenv_output.splitlines()}
-    if expected_env_var_name not in env_vars:
-        raise errors.SanityCheckError(f"the {expected_env_var_name} environment variable is not defined.")
-    if expected_env_var_value is not None and env_vars[expected_env_var_name] != expected_env_var_value:
-        raise errors.SanityCheckError(
-            f"the {expected_env_var_name} environment variable is defined but has an unexpected value: {env_vars[expected_env_var_name]}."
-        )
+    env_vars = {name: value for name, _, value in (line.partition("=") for line in printenv_output.splitlines())}
+    for expected_env_var_name, expected_env_var_value in expected_env_vars.items():
+        if expected_env_var_name not in env_vars:
+            raise errors.SanityCheckError(f"the {expected_env_var_name} environment variable is not defined.")
+        if expected_env_var_value is not None and env_vars[expected_env_var_name] != expected_env_var_value:
+            raise errors.SanityCheckError(
+                f"the {expected_env_var_name} environment variable is defined but has an unexpected value: {env_vars[expected_env_var_name]}."
+            )
 
 
 async def check_timezone_is_utc(container: dagger.Container):
@@ -60,7 +60,8 @@ class VersionRegistry:
         entries: List[VersionRegistryEntry],
     ) -> None:
         self.ConnectorBaseImageClass: Type[AirbyteConnectorBaseImage] = ConnectorBaseImageClass
-        self._entries: List[VersionRegistryEntry] = entries
+        # Entries are kept sorted by version number in descending order so that lookups don't have to sort them again.
+        self._entries: List[VersionRegistryEntry] = sorted(entries, key=lambda entry: entry.version, reverse=True)
 
     @staticmethod
     def get_changelog_dump_path(ConnectorBaseImageClass: Type[AirbyteConnectorBaseImage]) -> Path:
@@ -176,6 +177,7 @@ class VersionRegistry:
             List[VersionRegistryEntry]: All the entries sorted by version number in descending order.
         """
         self._entries.append(new_entry)
+        self._entries.sort(key=lambda entry: entry.version, reverse=True)
         self.save_changelog()
         return self.entries
 
@@ -186,7 +188,7 @@ class VersionRegistry:
         Returns:
             List[Type[VersionRegistryEntry]]: All the published versions sorted by version number in descending order.
         """
-        return sorted(self._entries, key=lambda entry: entry.version, reverse=True)
+        return list(self._entries)
 
     @property
     def latest_entry(self) -> Optional[VersionRegistryEntry]:
@@ -197,7 +199,7 @@ class VersionRegistry:
             Optional[VersionRegistryEntry]: The latest registry entry, or None if no entry is available.
         """
         try:
-            return self.entries[0]
+            return self._entries[0]
         except IndexError:
             return None
 
@@ -210,8 +212,8 @@ class VersionRegistry:
             Optional[VersionRegistryEntry]: The latest published registry entry, or None if no entry is available.
         """
         try:
-            return [entry for entry in self.entries if entry.published][0]
-        except IndexError:
+            return next(entry for entry in self._entries if entry.published)
+        except StopIteration:
             return None
 
     def get_entry_for_version(self, version: semver.VersionInfo) -> Optional[VersionRegistryEntry]:
@@ -220,7 +222,7 @@ class VersionRegistry:
         Returns:
             Optional[VersionRegistryEntry]: The registry entry for the given version, or None if no entry is available.
         """
-        for entry in self.entries:
+        for entry in self._entries:
             if entry.version == version:
                 return entry
         return None
@@ -234,9 +236,8 @@ class VersionRegistry:
             Optional[VersionRegistryEntry]: The latest registry entry with a not pre-released version, or None if no entry is available.
         """
         try:
-            not_pre_release_published_entries = [entry for entry in self.entries if not entry.version.prerelease and entry.published]
-            return not_pre_release_published_entries[0]
-        except IndexError:
+            return next(entry for entry in self._entries if not entry.version.prerelease and entry.published)
+        except StopIteration:
             return None
 
 
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 from contextlib import nullcontext as does_not_raise
 
 import pytest
@@ -30,6 +31,23 @@ async def test_check_env_var_with_printenv(dagger_client, docker_image, expected
         await sanity_checks.check_env_var_with_printenv(container_without_printenv, expected_env_var_name, expected_env_var_value)
 
 
+@pytest.mark.parametrize(
+    "docker_image, expected_env_vars, expected_error",
+    [
+        (root_images.PYTHON_3_9_18.address, {"PYTHON_VERSION": "3.9.18", "HOME": None}, does_not_raise()),
+        (root_images.PYTHON_3_9_18.address, {"PYTHON_VERSION": "3.9.19", "HOME": None}, pytest.raises(SanityCheckError)),
+        (root_images.PYTHON_3_9_18.address, {"PYTHON_VERSION": "3.9.18", "NOT_EXISTING_ENV_VAR": None}, pytest.raises(SanityCheckError)),
+    ],
+)
+async def test_check_env_vars_with_printenv(dagger_client, docker_image, expected_env_vars, expected_error):
+    container = dagger_client.container().from_(docker_image)
+    with expected_error:
+        await sanity_checks.check_env_vars_with_printenv(container, expected_env_vars)
+    container_without_printenv = container.with_exec(["rm", "/usr/bin/printenv"], skip_entrypoint=True)
+    with pytest.raises(SanityCheckError):
+        await sanity_checks.check_env_vars_with_printenv(container_without_printenv, expected_env_vars)
+
+
 async def test_check_timezone_is_utc(dagger_client):
     container = dagger_client.container().from_(root_images.PYTHON_3_9_18.address)
     # This containers has UTC as timezone by default
@@ -110,3 +128,21 @@ async def test_check_socat_version(mocker):
 
     # No exception should be raised by this function call
     await sanity_checks.check_socat_version(mock_container, expected_version)
+
+
+async def test_run_concurrently_waits_for_all_checks_before_raising_the_first_failure():
+    completed_checks = []
+
+    async def failing_check():
+        raise SanityCheckError("first failure")
+
+    async def slow_check():
+        await asyncio.sleep(0.1)
+        completed_checks.append("slow_check")
+
+    async def other_failing_check():
+        raise SanityCheckError("second failure")
+
+    with pytest.raises(SanityCheckError, match="first failure"):
+        await sanity_checks.run_concurrently(failing_check(), slow_check(), other_failing_check())
+    assert completed_checks == ["slow_check"]
@@ -7,6 +7,7 @@ import logging
 import asyncclick as click
 from pipelines.cli.click_decorators import click_ignore_unused_kwargs, click_merge_args_into_context_obj
 from pipelines.consts import DOCKER_VERSION
+from pipelines.dagger.containers.python import with_pip_cache, with_poetry_cache
 from pipelines.helpers.utils import sh_dash_c
 from pipelines.models.contexts.click_pipeline_context import ClickPipelineContext, pass_pipeline_context
 
@@ -35,7 +36,7 @@ async def test(pipeline_context: ClickPipelineContext):
 
     pipeline_name = f"Unit tests for {poetry_package_path}"
     dagger_client = await pipeline_context.get_dagger_client(pipeline_name=pipeline_name)
-    pytest_container = await (
+    test_environment = (
         dagger_client.container()
         .from_("python:3.10.12")
         .with_env_variable("PIPX_BIN_DIR", "/usr/local/bin")
@@ -52,7 +53,12 @@ async def test(pipeline_context: ClickPipelineContext):
         )
         .with_env_variable("VERSION", DOCKER_VERSION)
         .with_exec(sh_dash_c(["curl -fsSL https://get.docker.com | sh"]))
-        .with_mounted_directory(
+    )
+    # Persist the pip and poetry caches so that `poetry install` does not download the package dependencies on every run
+    test_environment = with_poetry_cache(with_pip_cache(test_environment, dagger_client), dagger_client)
+
+    pytest_container = await (
+        test_environment.with_mounted_directory(
             "/airbyte",
             dagger_client.host().directory(
                 ".",
@@ -61,6 +67,8 @@ async def test(pipeline_context: ClickPipelineContext):
             ),
         )
         .with_workdir(f"/airbyte/{poetry_package_path}")
+        # Install in the system environment: the default virtualenv location is inside the shared poetry cache volume
+        .with_exec(["poetry", "config", "virtualenvs.create", "false"])
         .with_exec(["poetry", "install"])
         .with_unix_socket("/var/run/docker.sock", dagger_client.host().unix_socket("/var/run/docker.sock"))
         .with_exec(["poetry", "run", "pytest", test_directory])
@@ -3,7 +3,8 @@
 #
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
 
 import pendulum
@@ -142,6 +143,15 @@ REPORT_FIELD_TYPES = {
 }
 
 
+@lru_cache(maxsize=4096)
+def parse_hourly_report_timestamp(datestring: str) -> int:
+    """
+    Parse a "YYYY-MM-DD|H" hourly report date as a UTC timestamp.
+    Every record of a given hour shares the same date string so parsed values are cached.
+    """
+    return int(datetime.strptime(datestring, "%Y-%m-%d|%H").replace(tzinfo=timezone.utc).timestamp())
+
+
 class ReportsMixin(ABC):
     # The directory where the file with report will be downloaded.
     file_directory: str = "/tmp"
@@ -299,7 +309,7 @@ class ReportsMixin(ABC):
             date = pendulum.from_format(datestring, "M/D/YYYY")
         else:
             if self.report_aggregation == "Hourly":
-                date = pendulum.from_format(datestring, "YYYY-MM-DD|H")
+                return parse_hourly_report_timestamp(datestring)
             else:
                 date = pendulum.parse(datestring)
 
@@ -2,28 +2,68 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import copy
-from unittest.mock import Mock
+import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
 import pendulum
 import pytest
 from bingads.v13.internal.reporting.row_report_iterator import _RowReportRecord, _RowValues
-from source_bing_ads.reports import PerformanceReportsMixin, ReportsMixin
-from source_bing_ads.source import SourceBingAds
+from source_bing_ads.reports import PerformanceReportsMixin, ReportsMixin, parse_hourly_report_timestamp
 from source_bing_ads.streams import (
+    AccountImpressionPerformanceReportHourly,
+    AccountPerformanceReportHourly,
+    AdGroupImpressionPerformanceReportHourly,
+    AdGroupPerformanceReportHourly,
+    AdPerformanceReportHourly,
+    AgeGenderAudienceReportHourly,
     BingAdsReportingServiceStream,
+    CampaignImpressionPerformanceReportHourly,
+    CampaignPerformanceReportHourly,
     GeographicPerformanceReportDaily,
     GeographicPerformanceReportHourly,
     GeographicPerformanceReportMonthly,
     GeographicPerformanceReportWeekly,
+    KeywordPerformanceReportHourly,
+    SearchQueryPerformanceReportHourly,
+    UserLocationPerformanceReportHourly,
+)
+
+# Read-only so that a stream writing to its config fails instead of leaking state to the other tests
+TEST_CONFIG = MappingProxyType(
+    {
+        "developer_token": "developer_token",
+        "client_id": "client_id",
+        "refresh_token": "refresh_token",
+        "reports_start_date": "2020-01-01T00:00:00Z",
+    }
+)
+LOOKBACK_WINDOW = 10
+REPORTS_START_DATE = pendulum.parse("2021-04-07T00:00:00")
+REPORTS_START_DATE_WITH_LOOKBACK = REPORTS_START_DATE.subtract(days=LOOKBACK_WINDOW)
+ROW_REPORT_RECORD = _RowReportRecord(
+    _RowValues(
+        {"AccountId": 1, "AverageCpc": 3, "AdGroupId": 2, "AccountName": 5, "Spend": 4},
+        {3: "11.5", 1: "33", 2: "--", 5: "123456789", 4: "120.3%"},
+    )
 )
 
 
+@lru_cache(maxsize=None)
+def parse_timestamp(datestring: str) -> float:
+    # The same few dates are parsed by many tests and parametrized cases
+    return pendulum.parse(datestring).timestamp()
+
+
 class TestClient:
     pass
 
 
-class TestReport(ReportsMixin, BingAdsReportingServiceStream, SourceBingAds):
+# The report streams only store their client when instantiated so a single stub can be shared
+TEST_CLIENT = TestClient()
+
+
+class TestReport(ReportsMixin, BingAdsReportingServiceStream):
     date_format, report_columns, report_name, cursor_field = "YYYY-MM-DD", None, None, "Time"
     report_aggregation = "Monthly"
     report_schema_name = "campaign_performance_report"
@@ -32,7 +72,7 @@ class TestReport(ReportsMixin, BingAdsReportingServiceStream, SourceBingAds):
         self.client = TestClient()
 
 
-class TestPerformanceReport(PerformanceReportsMixin, BingAdsReportingServiceStream, SourceBingAds):
+class TestPerformanceReport(PerformanceReportsMixin, BingAdsReportingServiceStream):
     date_format, report_columns, report_name, cursor_field = "YYYY-MM-DD", None, None, "Time"
     report_aggregation = "Monthly"
     report_schema_name = "campaign_performance_report"
@@ -41,111 +81,141 @@ class TestPerformanceReport(PerformanceReportsMixin, BingAdsReportingServiceStre
         self.client = TestClient()
 
 
-def test_get_column_value():
-    row_values = _RowValues(
-        {"AccountId": 1, "AverageCpc": 3, "AdGroupId": 2, "AccountName": 5, "Spend": 4},
-        {3: "11.5", 1: "33", 2: "--", 5: "123456789", 4: "120.3%"},
-    )
-    record = _RowReportRecord(row_values)
-
-    test_report = TestReport()
-    assert test_report.get_column_value(record, "AccountId") == "33"
-    assert test_report.get_column_value(record, "AverageCpc") == "11.5"
-    assert test_report.get_column_value(record, "AdGroupId") is None
-    assert test_report.get_column_value(record, "AccountName") == "123456789"
-    assert test_report.get_column_value(record, "Spend") == "120.3"
+@pytest.fixture(name="test_report")
+def report_fixture():
+    return TestReport()
 
 
-def test_get_updated_state_init_state():
-    test_report = TestReport()
-    stream_state = {}
-    latest_record = {"AccountId": 123, "Time": "2020-01-02"}
-    new_state = test_report.get_updated_state(stream_state, latest_record)
-    assert new_state["123"]["Time"] == (pendulum.parse("2020-01-02")).timestamp()
+@pytest.fixture(name="make_report")
+def make_report_fixture():
+    def _make_report(report_cls=TestReport, start_date=None, cursor_field=None, config=None):
+        report = report_cls()
+        if start_date is not None:
+            report.client.reports_start_date = start_date
+        if cursor_field is not None:
+            report.cursor_field = cursor_field
+        if config is not None:
+            report.config = config
+        return report
 
+    return _make_report
 
-def test_get_updated_state_new_state():
-    test_report = TestReport()
-    stream_state = {"123": {"Time": pendulum.parse("2020-01-01").timestamp()}}
-    latest_record = {"AccountId": 123, "Time": "2020-01-02"}
-    new_state = test_report.get_updated_state(stream_state, latest_record)
-    assert new_state["123"]["Time"] == pendulum.parse("2020-01-02").timestamp()
 
+def test_get_column_value(test_report):
+    expected_column_values = [
+        ("AccountId", "33"),
+        ("AverageCpc", "11.5"),
+        ("AdGroupId", None),
+        ("AccountName", "123456789"),
+        ("Spend", "120.3"),
+    ]
+    for column, expected_value in expected_column_values:
+        assert test_report.get_column_value(ROW_REPORT_RECORD, column) == expected_value, column
 
-def test_get_updated_state_state_unchanged():
-    test_report = TestReport()
-    stream_state = {"123": {"Time": pendulum.parse("2020-01-03").timestamp()}}
-    latest_record = {"AccountId": 123, "Time": "2020-01-02"}
-    new_state = test_report.get_updated_state(copy.deepcopy(stream_state), latest_record)
-    assert stream_state == new_state
 
-
-def test_get_updated_state_state_new_account():
-    test_report = TestReport()
-    stream_state = {"123": {"Time": pendulum.parse("2020-01-03").timestamp()}}
-    latest_record = {"AccountId": 234, "Time": "2020-01-02"}
-    new_state = test_report.get_updated_state(stream_state, latest_record)
-    assert "234" in new_state and "123" in new_state
-    assert new_state["234"]["Time"] == pendulum.parse("2020-01-02").timestamp()
+@pytest.mark.parametrize(
+    "stream_state, latest_record, expected_state",
+    [
+        (
+            {},
+            {"AccountId": 123, "Time": "2020-01-02"},
+            {"123": {"Time": parse_timestamp("2020-01-02")}},
+        ),
+        (
+            {"123": {"Time": parse_timestamp("2020-01-01")}},
+            {"AccountId": 123, "Time": "2020-01-02"},
+            {"123": {"Time": parse_timestamp("2020-01-02")}},
+        ),
+        (
+            {"123": {"Time": parse_timestamp("2020-01-03")}},
+            {"AccountId": 123, "Time": "2020-01-02"},
+            {"123": {"Time": parse_timestamp("2020-01-03")}},
+        ),
+        (
+            {"123": {"Time": parse_timestamp("2020-01-03")}},
+            {"AccountId": 234, "Time": "2020-01-02"},
+            {"123": {"Time": parse_timestamp("2020-01-03")}, "234": {"Time": parse_timestamp("2020-01-02")}},
+        ),
+    ],
+    ids=["init_state", "new_state", "state_unchanged", "state_new_account"],
+)
+def test_get_updated_state(test_report, stream_state, latest_record, expected_state):
+    assert test_report.get_updated_state(stream_state, latest_record) == expected_state
 
 
-def test_get_report_record_timestamp_daily():
-    test_report = TestReport()
+def test_get_report_record_timestamp_daily(test_report):
     test_report.report_aggregation = "Daily"
-    assert pendulum.parse("2020-01-01").timestamp() == test_report.get_report_record_timestamp("2020-01-01")
+    assert parse_timestamp("2020-01-01") == test_report.get_report_record_timestamp("2020-01-01")
 
 
-def test_get_report_record_timestamp_without_aggregation():
-    test_report = TestReport()
+def test_get_report_record_timestamp_without_aggregation(test_report):
     test_report.report_aggregation = None
-    assert pendulum.parse("2020-07-20").timestamp() == test_report.get_report_record_timestamp("7/20/2020")
+    assert parse_timestamp("2020-07-20") == test_report.get_report_record_timestamp("7/20/2020")
 
 
-def test_get_report_record_timestamp_hourly():
-    test_report = TestReport()
+@pytest.mark.parametrize(
+    "stream_report_hourly_cls",
+    (
+        AccountImpressionPerformanceReportHourly,
+        AccountPerformanceReportHourly,
+        AdGroupImpressionPerformanceReportHourly,
+        AdGroupPerformanceReportHourly,
+        AdPerformanceReportHourly,
+        AgeGenderAudienceReportHourly,
+        CampaignImpressionPerformanceReportHourly,
+        CampaignPerformanceReportHourly,
+        GeographicPerformanceReportHourly,
+        KeywordPerformanceReportHourly,
+        SearchQueryPerformanceReportHourly,
+        UserLocationPerformanceReportHourly,
+    ),
+)
+def test_get_report_record_timestamp_hourly(stream_report_hourly_cls):
+    stream_report = stream_report_hourly_cls(client=TEST_CLIENT, config=TEST_CONFIG)
+    assert parse_timestamp("2020-01-01T15:00:00") == stream_report.get_report_record_timestamp("2020-01-01|15")
+
+
+def test_get_report_record_timestamp_hourly_is_cached(test_report):
     test_report.report_aggregation = "Hourly"
-    assert pendulum.parse("2020-01-01T15:00:00").timestamp() == test_report.get_report_record_timestamp("2020-01-01|15")
+    parse_hourly_report_timestamp.cache_clear()
+    first_timestamp = test_report.get_report_record_timestamp("2020-01-01|15")
+    assert test_report.get_report_record_timestamp("2020-01-01|15") == first_timestamp
+    assert parse_hourly_report_timestamp.cache_info().hits == 1
 
 
-def test_report_get_start_date_wo_stream_state():
+def test_report_get_start_date_wo_stream_state(make_report):
     expected_start_date = "2020-01-01"
-    test_report = TestReport()
-    test_report.client.reports_start_date = "2020-01-01"
+    test_report = make_report(start_date="2020-01-01")
     stream_state = {}
     account_id = "123"
     assert expected_start_date == test_report.get_start_date(stream_state, account_id)
 
 
-def test_report_get_start_date_with_stream_state():
-    expected_start_date = pendulum.parse("2023-04-17T21:29:57")
-    test_report = TestReport()
-    test_report.cursor_field = "cursor_field"
-    test_report.client.reports_start_date = "2020-01-01"
-    stream_state = {"123": {"cursor_field": 1681766997}}
-    account_id = "123"
-    assert expected_start_date == test_report.get_start_date(stream_state, account_id)
-
-
-def test_report_get_start_date_performance_report_with_stream_state():
-    expected_start_date = pendulum.parse("2023-04-07T21:29:57")
-    test_report = TestPerformanceReport()
-    test_report.cursor_field = "cursor_field"
-    test_report.config = {"lookback_window": 10}
+@pytest.mark.parametrize(
+    "report_cls, config, expected_start_date",
+    [
+        (TestReport, {}, datetime.datetime.fromisoformat("2023-04-17T21:29:57+00:00")),
+        (TestPerformanceReport, {"lookback_window": LOOKBACK_WINDOW}, datetime.datetime.fromisoformat("2023-04-07T21:29:57+00:00")),
+    ],
+    ids=["report", "performance_report"],
+)
+def test_report_get_start_date_with_stream_state(make_report, report_cls, config, expected_start_date):
+    test_report = make_report(report_cls, start_date="2020-01-01", cursor_field="cursor_field", config=config)
     stream_state = {"123": {"cursor_field": 1681766997}}
     account_id = "123"
     assert expected_start_date == test_report.get_start_date(stream_state, account_id)
 
 
-def test_report_get_start_date_performance_report_wo_stream_state():
-    days_to_subtract = 10
-    reports_start_date = pendulum.parse("2021-04-07T00:00:00")
-    test_report = TestPerformanceReport()
-    test_report.cursor_field = "cursor_field"
-    test_report.client.reports_start_date = reports_start_date
-    test_report.config = {"lookback_window": days_to_subtract}
+def test_report_get_start_date_performance_report_wo_stream_state(make_report):
+    test_performance_report = make_report(
+        TestPerformanceReport,
+        start_date=REPORTS_START_DATE,
+        cursor_field="cursor_field",
+        config={"lookback_window": LOOKBACK_WINDOW},
+    )
     stream_state = {}
     account_id = "123"
-    assert reports_start_date.subtract(days=days_to_subtract) == test_report.get_start_date(stream_state, account_id)
+    assert REPORTS_START_DATE_WITH_LOOKBACK == test_performance_report.get_start_date(stream_state, account_id)
 
 
 @pytest.mark.parametrize(
@@ -158,11 +228,4 @@ def test_report_get_start_date_performance_report_wo_stream_state():
     ),
 )
 def test_geographic_performance_report_pk(performance_report_cls):
-    config = {
-        "developer_token": "developer_token",
-        "client_id": "client_id",
-        "refresh_token": "refresh_token",
-        "reports_start_date": "2020-01-01T00:00:00Z",
-    }
-    stream = performance_report_cls(client=Mock(), config=config)
-    assert stream.primary_key is None
+    assert performance_report_cls.primary_key is None